@@ -0,0 +1,113 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+# See: https://spdx.org/licenses/
+
+import queue
+import threading
+import time
+import typing as ty
+
+
+class EventCapture:
+    """Load events from a reader on a background thread, so that reading the
+    next window of events overlaps with processing the previous ones.
+
+    Windows of at least min_delta_t microseconds are loaded following the wall
+    clock. Each window is kept as a tuple (events, t_start, delta_t), where
+    t_start is the reader time at which the window starts.
+
+    Parameters
+    ----------
+    reader:
+        Event reader providing load_delta_t and current_time, e.g. a
+        Metavision RawReader streaming from a camera.
+    min_delta_t: int
+        Minimum duration of a window in microseconds.
+    max_windows: int
+        Maximum number of windows kept. If more windows are loaded without
+        being collected, the oldest ones are dropped.
+    """
+
+    def __init__(self,
+                 reader,
+                 min_delta_t: int = 10000,
+                 max_windows: int = 100):
+        self.reader = reader
+        self.min_delta_t = min_delta_t
+        self.windows = queue.Queue(maxsize=max_windows)
+        self.paused = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._capture, daemon=True)
+
+    def start(self):
+        """Start loading events, if not started yet."""
+        if self.thread.ident is None:
+            self.thread.start()
+
+    def pause(self):
+        """Drop all windows loaded until get_windows is called again."""
+        self.paused.set()
+
+    def stop(self):
+        """Stop loading events and wait for the capture thread to finish."""
+        self.stopped.set()
+        if self.thread.ident is not None:
+            self.thread.join()
+
+    def get_windows(self) -> ty.List[tuple]:
+        """Collect all windows loaded since the last call, waiting for at
+        least one. Resumes the capture if it was paused.
+
+        Returns
+        -------
+        windows: list
+            Windows (events, t_start, delta_t) in the order they were loaded.
+        """
+        self.paused.clear()
+
+        windows = [self.windows.get()]
+        while True:
+            try:
+                windows.append(self.windows.get_nowait())
+            except queue.Empty:
+                break
+
+        for window in windows:
+            if isinstance(window, Exception):
+                raise RuntimeError(
+                    "Event capture stopped unexpectedly."
+                ) from window
+        return windows
+
+    def _put(self, item):
+        """Queue an item, dropping the oldest window if the queue is full."""
+        while True:
+            try:
+                self.windows.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.windows.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _capture(self):
+        """Load windows until stopped. Errors are handed to get_windows."""
+        try:
+            t_last = time.time_ns()
+            while not self.stopped.is_set():
+                t_now = time.time_ns()
+                delta_t = (t_now - t_last) // 1000
+                if delta_t < self.min_delta_t:
+                    time.sleep((self.min_delta_t - delta_t) / 1e6)
+                    continue
+
+                t_start = self.reader.current_time
+                events = self.reader.load_delta_t(delta_t)
+                t_last = t_now
+
+                if not self.paused.is_set():
+                    # The reader may reuse its buffer for the next window
+                    self._put((events.copy(), t_start, delta_t))
+        except Exception as error:
+            self._put(error)
@@ -0,0 +1,118 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+# See: https://spdx.org/licenses/
+
+import functools
+import numpy as np
+import typing as ty
+from numba import njit
+
+
+@njit(cache=True, inline="always")
+def _histo_quantized_u8(x, y, p, t, flat, t_start, delta_t, touched, n_touched,
+                        num_time_bins, polarities, height, width):
+    """Shared implementation of histo_quantized_u8 on the flattened volume."""
+    stride_t = polarities * height * width
+    stride_p = height * width
+    stride_y = width
+    # The scatter stays scalar on purpose: a vectorized gather-add-scatter
+    # loses counts whenever several events of one vector hit the same cell
+    for i in range(len(t)):
+        if not (0 <= x[i] < width and 0 <= y[i] < height
+                and 0 <= p[i] < polarities):
+            continue
+        t_bin = (t[i] - t_start) * num_time_bins // delta_t
+        t_bin = min(max(t_bin, 0), num_time_bins - 1)
+        index = t_bin * stride_t + p[i] * stride_p + y[i] * stride_y + x[i]
+        count = flat[index]
+        flat[index] = min(count + 1, 255)
+        if touched is not None and count == 0:
+            if n_touched < len(touched):
+                touched[n_touched] = index
+            n_touched += 1
+    return n_touched
+
+
+@njit(cache=True)
+def histo_quantized_u8(x: np.ndarray,
+                       y: np.ndarray,
+                       p: np.ndarray,
+                       t: np.ndarray,
+                       volume: np.ndarray,
+                       t_start: int,
+                       delta_t: int,
+                       touched: ty.Optional[np.ndarray] = None,
+                       n_touched: int = 0) -> int:
+    """Accumulate DVS events into a quantized uint8 event volume.
+
+    The counts saturate at 255. Events falling outside of the volume are
+    ignored. The volume is not reset, this is left to the caller.
+
+    Parameters
+    ----------
+    x: np.ndarray
+        x coordinates of the events.
+    y: np.ndarray
+        y coordinates of the events.
+    p: np.ndarray
+        Polarities of the events.
+    t: np.ndarray
+        Timestamps of the events in microseconds.
+    volume: np.ndarray
+        C-contiguous event volume of shape (time_bins, polarities, height,
+        width) and dtype uint8 the events are added to.
+    t_start: int
+        Start time in microseconds of the volume. Events outside of
+        [t_start, t_start + delta_t) are put in the first or last time bin.
+    delta_t: int
+        Duration in microseconds covered by the volume.
+    touched: np.ndarray, optional
+        Buffer receiving the flat indices of the cells incremented from zero,
+        which allows to clear a sparse volume without resetting all of it.
+    n_touched: int
+        Number of cells already recorded in touched.
+
+    Returns
+    -------
+    n_touched: int
+        Number of cells incremented from zero, including the ones recorded
+        before. Only the first len(touched) of them are stored in touched.
+    """
+    num_time_bins, polarities, height, width = volume.shape
+    return _histo_quantized_u8(x, y, p, t, volume.reshape(-1), t_start,
+                               delta_t, touched, n_touched, num_time_bins,
+                               polarities, height, width)
+
+
+@functools.lru_cache(maxsize=None)
+def specialize_histo_quantized_u8(shape: ty.Tuple[int, int, int, int]):
+    """Compile a version of histo_quantized_u8 for a fixed volume shape.
+
+    The shape and the strides derived from it are compiled in as constants,
+    which allows the compiler to fold the index computation. Kernels are
+    cached per shape.
+
+    Parameters
+    ----------
+    shape: tuple
+        Shape (time_bins, polarities, height, width) of the volumes the
+        kernel is called with.
+
+    Returns
+    -------
+    histo_quantized_u8: function
+        Kernel with the same signature as histo_quantized_u8. It raises a
+        ValueError if called with a volume of another shape.
+    """
+    num_time_bins, polarities, height, width = shape
+
+    @njit(cache=True)
+    def histo_quantized_u8_specialized(x, y, p, t, volume, t_start, delta_t,
+                                       touched=None, n_touched=0):
+        if volume.shape != (num_time_bins, polarities, height, width):
+            raise ValueError("Volume does not match the compiled shape.")
+        return _histo_quantized_u8(x, y, p, t, volume.reshape(-1), t_start,
+                                   delta_t, touched, n_touched,
+                                   num_time_bins, polarities, height, width)
+
+    return histo_quantized_u8_specialized
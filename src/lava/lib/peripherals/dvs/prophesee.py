@@ -12,6 +12,7 @@ except ImportError:
 
 import numpy as np
 import time
+import typing as ty
 
 from lava.magma.core.decorator import implements, requires, tag
 from lava.magma.core.model.py.model import PyLoihiProcessModel
@@ -21,10 +22,67 @@ from lava.magma.core.process.ports.ports import OutPort
 from lava.magma.core.process.process import AbstractProcess
 from lava.magma.core.resources import CPU
 from lava.magma.core.sync.protocols.loihi_protocol import LoihiProtocol
-from lava.lib.peripherals.dvs.transformation import Compose, EventVolume
+from lava.lib.peripherals.dvs.capture import EventCapture
+from lava.lib.peripherals.dvs.transformation import (
+    Compose,
+    Downsample,
+    EventVolume,
+    MergePolarities,
+    MirrorHorizontally,
+    MirrorVertically,
+)
+from lava.lib.peripherals.dvs.histogram import (
+    histo_quantized_u8,
+    specialize_histo_quantized_u8,
+)
 
 from metavision_core.event_io import RawReader, EventDatReader
-from metavision_ml.preprocessing.event_to_tensor import histo_quantized
+
+# Field layout of the Metavision EventCD events delivered by the readers,
+# 16 bytes per event with t aligned at offset 8
+EVENT_CD_DTYPE = np.dtype(
+    [("x", np.uint16), ("y", np.uint16), ("p", np.int16), ("t", np.int64)],
+    align=True,
+)
+
+# Transformation chains, together with the sensor and output shape, that
+# already passed the validation in PropheseeCamera
+_VALIDATED_TRANSFORMATIONS = set()
+
+# Transformations whose behaviour is fully determined by their parameters
+_CACHEABLE_TRANSFORMATIONS = (
+    Downsample,
+    MergePolarities,
+    MirrorHorizontally,
+    MirrorVertically,
+)
+
+
+def _transformations_key(transformations) -> ty.Optional[tuple]:
+    """Identify a transformation chain by the types and parameters of its
+    transformations. Returns None if the chain is not a Compose of built-in
+    transformations only, in which case its validation is not cached."""
+    if type(transformations) is not Compose:
+        return None
+
+    key = []
+    for t in transformations.transformations:
+        if type(t) not in _CACHEABLE_TRANSFORMATIONS:
+            return None
+        key.append(
+            (
+                type(t).__module__,
+                type(t).__qualname__,
+                tuple(sorted(vars(t).items())),
+            )
+        )
+
+    key = tuple(key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 
 class PropheseeCamera(AbstractProcess):
@@ -102,33 +160,51 @@ class PropheseeCamera(AbstractProcess):
                 event_shape.width,
             )
 
-        # Check whether provided transformation is valid
-        if self.transformations is not None:
+        # Check whether provided transformation is valid, unless an identical
+        # chain of built-in transformations was validated for the same shapes
+        transformations_key = _transformations_key(self.transformations)
+        validation_key = (
+            tuple(sensor_shape),
+            tuple(self.shape),
+            transformations_key,
+        )
+        if self.transformations is not None and (
+            transformations_key is None
+            or validation_key not in _VALIDATED_TRANSFORMATIONS
+        ):
             try:
                 # Generate some artificial data
                 n_random_spikes = 1000
-                test_data = np.zeros(
-                    n_random_spikes,
-                    dtype=np.dtype(
-                        [("y", int), ("x", int), ("p", int), ("t", int)]
-                    ),
+                test_data = np.empty(n_random_spikes, dtype=EVENT_CD_DTYPE)
+                rng = np.random.default_rng(0)
+                test_data["x"] = rng.integers(0, width, n_random_spikes)
+                test_data["y"] = rng.integers(0, height, n_random_spikes)
+                test_data["p"] = rng.integers(0, 2, n_random_spikes)
+                test_data["t"] = np.sort(
+                    rng.integers(0, 1_000_000, n_random_spikes)
                 )
-                test_data["x"] = np.random.rand(n_random_spikes) * width
-                test_data["y"] = np.random.rand(n_random_spikes) * height
-                test_data["p"] = np.random.rand(n_random_spikes) * 2
-                test_data["t"] = np.sort(np.random.rand(n_random_spikes) * 1e6)
 
                 # Transform data
                 self.transformations(test_data)
                 if len(test_data) > 0:
                     volume = np.zeros(self.shape, dtype=np.uint8)
-                    histo_quantized(test_data, volume, np.max(test_data["t"]))
+                    histo_quantized_u8(
+                        test_data["x"],
+                        test_data["y"],
+                        test_data["p"],
+                        test_data["t"],
+                        volume,
+                        test_data["t"][0],
+                        np.max(test_data["t"]) + 1,
+                    )
 
             except Exception:
                 raise Exception(
                     "Your transformation is not compatible with the provided \
                     data."
                 )
+            if transformations_key is not None:
+                _VALIDATED_TRANSFORMATIONS.add(validation_key)
 
         self.s_out = OutPort(shape=self.shape)
 
@@ -147,7 +223,7 @@ class PropheseeCamera(AbstractProcess):
 @requires(CPU)
 @tag("floating_pt")
 class PyPropheseeCameraModel(PyLoihiProcessModel):
-    s_out: PyOutPort = LavaPyType(PyOutPort.VEC_DENSE, np.int32)
+    s_out: PyOutPort = LavaPyType(PyOutPort.VEC_DENSE, np.uint8)
 
     def __init__(self, proc_params):
         super().__init__(proc_params)
@@ -185,56 +261,148 @@ class PyPropheseeCameraModel(PyLoihiProcessModel):
             ),
             dtype=np.uint8,
         )
-        self.t_pause = time.time_ns()
-        self.t_last_iteration = time.time_ns()
+        # Frame sent in time steps without any events
+        self.empty_frame = np.zeros_like(self.volume)
+        # Flat indices of the cells set in the last time step. If few enough
+        # cells were set, only these are cleared instead of the whole volume
+        self.touched = np.empty(self.volume.size // 64 + 1, dtype=np.int64)
+        self.n_touched = 0
+        # Output buffers of the filters, reused in every time step
+        self.filter_buffers = [
+            filter.get_empty_output_buffer() for filter in self.filters
+        ]
+
+        # Compile the histogram kernel for the output shape and the EventCD
+        # field types up front so the JIT cost does not hit a time step. NumPy
+        # flags the fields of arrays with up to one event as contiguous, while
+        # larger batches are strided views, so both layouts are compiled.
+        self.histo_quantized_u8 = specialize_histo_quantized_u8(
+            tuple(self.shape)
+        )
+        for n_events in (1, 2):
+            dummy_events = np.zeros(n_events, dtype=EVENT_CD_DTYPE)
+            self.histo_quantized_u8(
+                dummy_events["x"],
+                dummy_events["y"],
+                dummy_events["p"],
+                dummy_events["t"],
+                self.volume,
+                0,
+                1,
+                self.touched,
+                0,
+            )
+        self.volume.fill(0)
 
-    def run_spk(self):
-        """Load events from DVS, apply filters and transformations and send
-        spikes as frame"""
+        # Events of a camera are loaded by a background thread, started with
+        # the first time step, so that reading the next batch overlaps with
+        # processing the current one. Files are read directly in run_spk.
+        if self.filename == "":
+            self.capture = EventCapture(self.reader)
+        else:
+            self.capture = None
+        self.t_pause = self.t_last_iteration = time.time_ns()
+
+    def _load_windows(self):
+        """Load the windows (events, t_start, delta_t) of events since the
+        last time step."""
+        if self.capture is not None:
+            self.capture.start()
+            return self.capture.get_windows()
 
         # Time passed since last iteration
         t_now = time.time_ns()
 
-        # Load new events since last iteration
         if self.t_pause > self.t_last_iteration:
             # Runtime was paused in the meantime
-            delta_t = np.max(
-                [10000, (self.t_pause - self.t_last_iteration) // 1000]
-            )
-            delta_t_drop = np.max([10000, (t_now - self.t_pause) // 1000])
+            delta_t = max(10000, (self.t_pause - self.t_last_iteration) // 1000)
+            delta_t_drop = max(10000, (t_now - self.t_pause) // 1000)
 
+            t_start = self.reader.current_time
             events = self.reader.load_delta_t(delta_t)
             _ = self.reader.load_delta_t(delta_t_drop)
         else:
             # Runtime was not paused in the meantime
-            delta_t = np.max([10000, (t_now - self.t_last_iteration) // 1000])
+            delta_t = max(10000, (t_now - self.t_last_iteration) // 1000)
+            t_start = self.reader.current_time
             events = self.reader.load_delta_t(delta_t)
 
+        self.t_last_iteration = t_now
+        return [(events, t_start, delta_t)]
+
+    def run_spk(self):
+        """Load events from DVS, apply filters and transformations and send
+        spikes as frame"""
+
+        windows = self._load_windows()
+
+        if all(len(events) == 0 for events, _, _ in windows):
+            frames = self.empty_frame
+        else:
+            # Accumulate the windows one after another into the volume
+            # instead of concatenating them into one copy. The time bins span
+            # the windows back to back, starting at the first window.
+            delta_t = sum(window_delta_t for _, _, window_delta_t in windows)
+            self._clear_volume()
+            t_elapsed = 0
+            for events, t_start, window_delta_t in windows:
+                self._accumulate(events, t_start - t_elapsed, delta_t)
+                t_elapsed += window_delta_t
+            frames = self.volume
+
+        # Send
+        self.s_out.send(frames)
+
+    def _accumulate(self, events, t_start, delta_t):
+        """Apply filters and transformations to a window of events and add it
+        to the event volume, whose time bins start at t_start and span
+        delta_t."""
+
         # Apply filters to events
-        for filter in self.filters:
-            events_out = filter.get_empty_output_buffer()
+        for filter, events_out in zip(self.filters, self.filter_buffers):
             filter.process_events(events, events_out)
             events = events_out
 
         if len(self.filters) > 0:
-            events = events.numpy()
+            # View the filter output buffer as an EventCD array without a copy
+            events = events.numpy(copy=False)
 
         # Transform events
         if self.transformations is not None and len(events) > 0:
             self.transformations(events)
 
         # Transform to frame
-        if len(events) > 0:
-            histo_quantized(events, self.volume, delta_t, reset=True)
-            frames = self.volume
-        else:
-            frames = np.zeros(self.s_out.shape)
+        self.n_touched = self.histo_quantized_u8(
+            events["x"],
+            events["y"],
+            events["p"],
+            events["t"],
+            self.volume,
+            t_start,
+            delta_t,
+            self.touched,
+            self.n_touched,
+        )
 
-        # Send
-        self.s_out.send(frames)
-        self.t_last_iteration = t_now
+    def _clear_volume(self):
+        """Reset the event volume. After sparse time steps only the cells set
+        in the last time step are reset."""
+        if self.n_touched <= len(self.touched):
+            self.volume.reshape(-1)[self.touched[:self.n_touched]] = 0
+        else:
+            self.volume.fill(0)
+        self.n_touched = 0
 
     def _pause(self):
         """Pause was called by the runtime"""
         super()._pause()
-        self.t_pause = time.time_ns()
+        if self.capture is not None:
+            self.capture.pause()
+        else:
+            self.t_pause = time.time_ns()
+
+    def _stop(self):
+        """Stop was called by the runtime"""
+        if self.capture is not None:
+            self.capture.stop()
+        super()._stop()
@@ -3,10 +3,9 @@
 # See: https://spdx.org/licenses/
 
 from abc import abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 import numpy as np
-import copy
 import typing as ty
 
 
@@ -141,8 +140,10 @@ class Downsample(Transformation):
         events: np.ndarray
             Transformed DVS events
         """
-        events["x"] = (events["x"] * self.factor_x).astype(np.int32)
-        events["y"] = (events["y"] * self.factor_y).astype(np.int32)
+        np.multiply(events["x"], self.factor_x, out=events["x"],
+                    casting="unsafe")
+        np.multiply(events["y"], self.factor_y, out=events["y"],
+                    casting="unsafe")
         return events
 
     def determine_output_shape(self, input_shape: EventVolume) -> EventVolume:
@@ -158,10 +159,11 @@ class Downsample(Transformation):
          output_shape: EventVolume
              Shape of the outcoming events.
         """
-        output_shape = copy.deepcopy(input_shape)
-        output_shape.width = int(output_shape.width * self.factor_x)
-        output_shape.height = int(output_shape.height * self.factor_y)
-        return output_shape
+        return replace(
+            input_shape,
+            width=int(input_shape.width * self.factor_x),
+            height=int(input_shape.height * self.factor_y),
+        )
 
 
 class MergePolarities(Transformation):
@@ -177,7 +179,7 @@ class MergePolarities(Transformation):
         events: np.ndarray
             Transformed DVS events
         """
-        events["p"] = (events["p"] * 0).astype(np.int32)
+        events["p"] = 0
         return events
 
     def determine_output_shape(self, input_shape: EventVolume) -> EventVolume:
@@ -193,9 +195,7 @@ class MergePolarities(Transformation):
         output_shape: EventVolume
             Shape of the outcoming events.
         """
-        output_shape = copy.deepcopy(input_shape)
-        output_shape.polarities = 1
-        return output_shape
+        return replace(input_shape, polarities=1)
 
 
 class MirrorHorizontally(Transformation):
@@ -222,7 +222,8 @@ class MirrorHorizontally(Transformation):
         events: np.ndarray
             Transformed DVS events
         """
-        events["y"] = self.height - events["y"]
+        np.subtract(self.height, events["y"], out=events["y"],
+                    casting="unsafe")
         return events
 
     def determine_output_shape(self, input_shape: EventVolume) -> EventVolume:
@@ -265,7 +266,8 @@ class MirrorVertically(Transformation):
         events: np.ndarray
             Transformed DVS events
         """
-        events["x"] = self.width - events["x"]
+        np.subtract(self.width, events["x"], out=events["x"],
+                    casting="unsafe")
         return events
 
     def determine_output_shape(self, input_shape: EventVolume) -> EventVolume:
@@ -0,0 +1,111 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+# See: https://spdx.org/licenses/
+
+import queue
+import time
+import unittest
+
+import numpy as np
+
+from lava.lib.peripherals.dvs.capture import EventCapture
+
+
+class Reader:
+    """Reader emitting one event at the start of every loaded window."""
+
+    def __init__(self, fail: bool = False):
+        self.current_time = 0
+        self.fail = fail
+
+    def load_delta_t(self, delta_t):
+        if self.fail:
+            raise ValueError("Reader failed.")
+        events = np.zeros(
+            1,
+            dtype=np.dtype([("x", np.uint16), ("y", np.uint16),
+                            ("p", np.int16), ("t", np.int64)]),
+        )
+        events["t"] = self.current_time
+        self.current_time += delta_t
+        return events
+
+
+class TestEventCapture(unittest.TestCase):
+    def test_windows(self):
+        """Test that windows are contiguous and at least min_delta_t long."""
+        capture = EventCapture(Reader(), min_delta_t=1000)
+        capture.start()
+        time.sleep(0.05)
+        windows = capture.get_windows()
+        capture.stop()
+
+        self.assertGreater(len(windows), 1)
+        t_end = windows[0][1]
+        for events, t_start, delta_t in windows:
+            self.assertEqual(t_start, t_end)
+            self.assertGreaterEqual(delta_t, 1000)
+            self.assertEqual(events["t"][0], t_start)
+            t_end = t_start + delta_t
+
+    def test_not_started(self):
+        """Test that nothing is loaded before start and stop does not fail."""
+        reader = Reader()
+        capture = EventCapture(reader, min_delta_t=1000)
+        time.sleep(0.01)
+        capture.stop()
+
+        self.assertEqual(reader.current_time, 0)
+        self.assertTrue(capture.windows.empty())
+
+    def test_max_windows(self):
+        """Test that only the most recent windows are kept."""
+        reader = Reader()
+        capture = EventCapture(reader, min_delta_t=1000, max_windows=3)
+        capture.start()
+        time.sleep(0.05)
+        capture.stop()
+        windows = capture.get_windows()
+
+        self.assertEqual(len(windows), 3)
+        _, t_start, delta_t = windows[-1]
+        self.assertEqual(t_start + delta_t, reader.current_time)
+
+    def test_pause(self):
+        """Test that windows loaded during a pause are dropped."""
+        capture = EventCapture(Reader(), min_delta_t=1000)
+        capture.start()
+        capture.pause()
+        # Let a window that was being loaded during the pause call arrive
+        time.sleep(0.01)
+        while True:
+            try:
+                capture.windows.get_nowait()
+            except queue.Empty:
+                break
+
+        time.sleep(0.03)
+        self.assertTrue(capture.windows.empty())
+
+        # Collecting windows resumes the capture
+        self.assertGreater(len(capture.get_windows()), 0)
+        capture.stop()
+
+    def test_stop(self):
+        """Test that stop ends the capture thread."""
+        capture = EventCapture(Reader(), min_delta_t=1000)
+        capture.start()
+        capture.stop()
+
+        self.assertFalse(capture.thread.is_alive())
+
+    def test_error(self):
+        """Test that errors of the reader are raised by get_windows."""
+        capture = EventCapture(Reader(fail=True), min_delta_t=1000)
+        capture.start()
+
+        with self.assertRaises(RuntimeError) as context:
+            capture.get_windows()
+        self.assertIsInstance(context.exception.__cause__, ValueError)
+        capture.thread.join(timeout=1)
+        self.assertFalse(capture.thread.is_alive())
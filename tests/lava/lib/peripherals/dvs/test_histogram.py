@@ -0,0 +1,170 @@
+# Copyright (C) 2023 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+# See: https://spdx.org/licenses/
+
+import unittest
+import numpy as np
+
+from lava.lib.peripherals.dvs.histogram import (
+    histo_quantized_u8,
+    specialize_histo_quantized_u8,
+)
+
+
+def generate_events(n_events, shape, delta_t, seed=0):
+    """Generate random events with the EventCD field types."""
+    _, polarities, height, width = shape
+    rng = np.random.default_rng(seed)
+    events = np.zeros(
+        n_events,
+        dtype=np.dtype(
+            [("x", np.uint16), ("y", np.uint16), ("p", np.int16),
+             ("t", np.int64)]
+        ),
+    )
+    events["x"] = rng.integers(0, width, n_events)
+    events["y"] = rng.integers(0, height, n_events)
+    events["p"] = rng.integers(0, polarities, n_events)
+    events["t"] = np.sort(rng.integers(0, delta_t, n_events))
+    return events
+
+
+def reference_histogram(events, shape, t_start, delta_t):
+    """Compute the expected event volume with plain numpy."""
+    num_time_bins = shape[0]
+    t_bins = np.minimum((events["t"] - t_start) * num_time_bins // delta_t,
+                        num_time_bins - 1)
+    counts = np.zeros(shape, dtype=np.int64)
+    np.add.at(counts, (t_bins, events["p"], events["y"], events["x"]), 1)
+    return np.minimum(counts, 255).astype(np.uint8)
+
+
+class TestHistoQuantizedU8(unittest.TestCase):
+    def test_matches_reference(self):
+        shape = (3, 2, 24, 32)
+        delta_t = 10000
+        events = generate_events(5000, shape, delta_t)
+
+        volume = np.zeros(shape, dtype=np.uint8)
+        histo_quantized_u8(events["x"], events["y"], events["p"],
+                           events["t"], volume, events["t"][0], delta_t)
+
+        np.testing.assert_equal(volume,
+                                reference_histogram(events, shape,
+                                                    events["t"][0], delta_t))
+
+    def test_accumulate_batches(self):
+        shape = (2, 2, 24, 32)
+        delta_t = 10000
+        events = generate_events(5000, shape, delta_t)
+
+        volume = np.zeros(shape, dtype=np.uint8)
+        for batch in np.array_split(events, 3):
+            histo_quantized_u8(batch["x"], batch["y"], batch["p"],
+                               batch["t"], volume, 0, delta_t)
+
+        np.testing.assert_equal(volume,
+                                reference_histogram(events, shape, 0, delta_t))
+
+    def test_saturation(self):
+        shape = (1, 2, 4, 4)
+        events = generate_events(1000, shape, 100)
+        events["x"] = 1
+        events["y"] = 2
+        events["p"] = 1
+
+        volume = np.zeros(shape, dtype=np.uint8)
+        histo_quantized_u8(events["x"], events["y"], events["p"],
+                           events["t"], volume, 0, 100)
+
+        self.assertEqual(volume[0, 1, 2, 1], 255)
+        self.assertEqual(volume.sum(), 255)
+
+    def test_events_outside_volume_are_ignored(self):
+        shape = (1, 1, 4, 4)
+        events = generate_events(3, shape, 100)
+        events["x"] = [0, 4, 1]
+        events["y"] = [0, 1, 4]
+        events["p"] = [0, 0, 1]
+
+        volume = np.zeros(shape, dtype=np.uint8)
+        histo_quantized_u8(events["x"], events["y"], events["p"],
+                           events["t"], volume, 0, 100)
+
+        self.assertEqual(volume[0, 0, 0, 0], 1)
+        self.assertEqual(volume.sum(), 1)
+
+    def test_no_events(self):
+        shape = (1, 2, 4, 4)
+        events = generate_events(0, shape, 100)
+
+        volume = np.zeros(shape, dtype=np.uint8)
+        histo_quantized_u8(events["x"], events["y"], events["p"],
+                           events["t"], volume, 0, 100)
+
+        self.assertEqual(volume.sum(), 0)
+
+    def test_touched_cells(self):
+        shape = (2, 2, 24, 32)
+        delta_t = 10000
+        events = generate_events(200, shape, delta_t)
+
+        volume = np.zeros(shape, dtype=np.uint8)
+        touched = np.empty(volume.size, dtype=np.int64)
+        n_touched = histo_quantized_u8(events["x"], events["y"], events["p"],
+                                       events["t"], volume, 0, delta_t,
+                                       touched, 0)
+
+        self.assertEqual(n_touched, np.count_nonzero(volume))
+        np.testing.assert_equal(np.sort(touched[:n_touched]),
+                                np.flatnonzero(volume))
+
+        # Only as many cells as fit are recorded, but all of them are counted
+        volume.fill(0)
+        touched = np.empty(10, dtype=np.int64)
+        self.assertEqual(
+            histo_quantized_u8(events["x"], events["y"], events["p"],
+                               events["t"], volume, 0, delta_t, touched, 0),
+            n_touched,
+        )
+        self.assertTrue(np.all(volume.reshape(-1)[touched] > 0))
+
+
+class TestSpecializeHistoQuantizedU8(unittest.TestCase):
+    def test_matches_generic_kernel(self):
+        delta_t = 10000
+        for shape in [(1, 2, 24, 32), (3, 1, 17, 5)]:
+            events = generate_events(5000, shape, delta_t)
+            histo_quantized_u8_specialized = specialize_histo_quantized_u8(
+                shape
+            )
+
+            volume = np.zeros(shape, dtype=np.uint8)
+            n_touched = histo_quantized_u8(
+                events["x"], events["y"], events["p"], events["t"], volume,
+                0, delta_t, np.empty(volume.size, dtype=np.int64), 0)
+            volume_specialized = np.zeros(shape, dtype=np.uint8)
+            n_touched_specialized = histo_quantized_u8_specialized(
+                events["x"], events["y"], events["p"], events["t"],
+                volume_specialized, 0, delta_t,
+                np.empty(volume.size, dtype=np.int64), 0)
+
+            np.testing.assert_equal(volume_specialized, volume)
+            self.assertEqual(n_touched_specialized, n_touched)
+
+    def test_cached_per_shape(self):
+        self.assertIs(specialize_histo_quantized_u8((1, 2, 4, 4)),
+                      specialize_histo_quantized_u8((1, 2, 4, 4)))
+        self.assertIsNot(specialize_histo_quantized_u8((1, 2, 4, 4)),
+                         specialize_histo_quantized_u8((1, 1, 4, 4)))
+
+    def test_shape_mismatch(self):
+        events = generate_events(10, (1, 2, 4, 4), 100)
+        histo_quantized_u8_specialized = specialize_histo_quantized_u8(
+            (1, 2, 4, 4)
+        )
+
+        with self.assertRaises(ValueError):
+            histo_quantized_u8_specialized(
+                events["x"], events["y"], events["p"], events["t"],
+                np.zeros((1, 2, 4, 3), dtype=np.uint8), 0, 100)
@@ -26,10 +26,16 @@ from lava.magma.core.run_configs import Loihi2SimCfg
 from lava.magma.core.run_conditions import RunSteps, RunContinuous
 
 from lava.lib.peripherals.dvs.prophesee import (
+    EVENT_CD_DTYPE,
     PropheseeCamera,
     PyPropheseeCameraModel,
+    _transformations_key,
+)
+from lava.lib.peripherals.dvs.transformation import (
+    Compose,
+    Downsample,
+    MergePolarities,
 )
-from lava.lib.peripherals.dvs.transformation import Compose, Downsample
 from metavision_core.utils import get_sample
 from metavision_core.event_io import RawReader, EventDatReader
 from metavision_sdk_cv import ActivityNoiseFilterAlgorithm
@@ -141,6 +147,45 @@ class TestPropheseeCamera(unittest.TestCase):
             )
 
 
+class TestTransformationsKey(unittest.TestCase):
+    def test_builtin_transformations(self):
+        """Test that chains of built-in transformations are identified by
+        their parameters."""
+        key = _transformations_key(
+            Compose([MergePolarities(), Downsample(factor=0.5)])
+        )
+
+        self.assertIsNotNone(key)
+        self.assertEqual(
+            key,
+            _transformations_key(
+                Compose([MergePolarities(), Downsample(factor=0.5)])
+            ),
+        )
+        self.assertNotEqual(
+            key,
+            _transformations_key(
+                Compose([MergePolarities(), Downsample(factor=0.25)])
+            ),
+        )
+
+    def test_other_transformations(self):
+        """Test that chains with other transformations are not cached."""
+
+        class SlottedDownsample(Downsample):
+            __slots__ = ("offset",)
+
+        def shift(events):
+            events["x"] += 1
+            return events
+
+        self.assertIsNone(_transformations_key(None))
+        self.assertIsNone(_transformations_key(Compose([shift])))
+        self.assertIsNone(
+            _transformations_key(Compose([SlottedDownsample(factor=0.5)]))
+        )
+
+
 class TestPyPropheseeCameraModel(unittest.TestCase):
     def test_init(self):
         """Test that the PyPropheseeCameraModel ProcessModel is instantiated
@@ -175,6 +220,117 @@ class TestPyPropheseeCameraModel(unittest.TestCase):
 
         self.assertIsInstance(pm, PyPropheseeCameraModel)
         self.assertIsInstance(pm.reader, RawReader)
+        # Files are read in run_spk without a capture thread
+        self.assertIsNone(pm.capture)
+
+    def test_kernel_warm_up(self):
+        """Test that no event batch needs another compilation of the
+        histogram kernel after the ProcessModel is created."""
+        proc_params = {
+            "shape": (1, 2, 4, 4),
+            "filename": SEQUENCE_FILENAME_RAW,
+            "biases": None,
+            "filters": [],
+            "max_events_per_dt": 10**8,
+            "transformations": None,
+            "num_output_time_bins": 1,
+        }
+        pm = PyPropheseeCameraModel(proc_params)
+        n_signatures = len(pm.histo_quantized_u8.signatures)
+
+        for n_events in (0, 1, 5):
+            events = np.zeros(n_events, dtype=EVENT_CD_DTYPE)
+            pm._accumulate(events, 0, 10000)
+            self.assertEqual(len(pm.histo_quantized_u8.signatures),
+                             n_signatures)
+
+    def test_time_bins_start_at_first_window(self):
+        """Test that the time bins are anchored at the start of the first
+        window loaded in a time step, even if it holds no events."""
+
+        class Port:
+            def send(self, data):
+                self.data = data.copy()
+
+        proc_params = {
+            "shape": (2, 2, 4, 4),
+            "filename": SEQUENCE_FILENAME_RAW,
+            "biases": None,
+            "filters": [],
+            "max_events_per_dt": 10**8,
+            "transformations": None,
+            "num_output_time_bins": 2,
+        }
+        pm = PyPropheseeCameraModel(proc_params)
+        pm.s_out = Port()
+
+        events = np.zeros(10, dtype=EVENT_CD_DTYPE)
+        events["t"] = 10000 + np.arange(10) * 1000
+        pm._load_windows = lambda: [
+            (np.zeros(0, dtype=EVENT_CD_DTYPE), 0, 10000),
+            (events, 10000, 10000),
+        ]
+        pm.run_spk()
+
+        # All events lie in the second half of the time step
+        self.assertEqual(pm.s_out.data[0].sum(), 0)
+        self.assertEqual(pm.s_out.data[1].sum(), 10)
+
+    def test_clear_volume(self):
+        """Test that each sent frame only holds the events of its own time
+        step, whether the volume is reset completely or only in the cells
+        set in the previous time step."""
+
+        class Port:
+            def send(self, data):
+                self.data = data.copy()
+
+        shape = (1, 2, 32, 32)
+        proc_params = {
+            "shape": shape,
+            "filename": SEQUENCE_FILENAME_RAW,
+            "biases": None,
+            "filters": [],
+            "max_events_per_dt": 10**8,
+            "transformations": None,
+            "num_output_time_bins": 1,
+        }
+        pm = PyPropheseeCameraModel(proc_params)
+        pm.s_out = Port()
+        rng = np.random.default_rng(0)
+
+        def generate_events(n_events):
+            events = np.zeros(n_events, dtype=EVENT_CD_DTYPE)
+            events["x"] = rng.integers(0, shape[3], n_events)
+            events["y"] = rng.integers(0, shape[2], n_events)
+            events["p"] = rng.integers(0, shape[1], n_events)
+            events["t"] = np.sort(rng.integers(0, 10000, n_events))
+            return events
+
+        dense_events = generate_events(1000)
+        steps = [
+            # Dense step, setting more cells than fit into pm.touched
+            [dense_events[:600], dense_events[600:]],
+            # Sparse steps, with an empty time step in between
+            [generate_events(5)],
+            [np.zeros(0, dtype=EVENT_CD_DTYPE)],
+            [generate_events(3), np.zeros(0, dtype=EVENT_CD_DTYPE)],
+        ]
+        self.assertGreater(np.unique(dense_events[["p", "y", "x"]]).size,
+                           len(pm.touched))
+
+        for step in steps:
+            pm._load_windows = lambda: [
+                (events, 0, 10000) for events in step
+            ]
+            pm.run_spk()
+
+            expected = np.zeros(shape, dtype=np.int64)
+            for events in step:
+                np.add.at(expected,
+                          (0, events["p"], events["y"], events["x"]), 1)
+            np.testing.assert_equal(pm.s_out.data,
+                                    np.minimum(expected, 255))
 
     def test_base_functionality_file(self):
         """Test that running a PropheseeCamera works using a data file."""